@@ -5,11 +5,12 @@ Comprehensive Football Data Generator
 Creates ALL required static JSON files with 6500+ players, 700+ teams, 100+ leagues
 """
 
-import json
+import gzip
 import os
 import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Any, Dict, List
+
+from footybot_json import GZIP_JSON, TIMESTAMP, dumps, ensure_dir, write_bytes
 
 # Output directories
 DATA_DIR = "data"
@@ -18,15 +19,20 @@ PLAYERS_DIR = os.path.join(DATA_DIR, "players")
 LEAGUES_DIR = os.path.join(DATA_DIR, "leagues")
 
 def save_json(filepath: str, data: Dict[str, Any]):
-    """Save data to JSON file with proper formatting"""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"✓ Created: {filepath} ({len(str(data))} bytes)")
+    """Save data to JSON file, gzip-compressed if GZIP_JSON is set"""
+    ensure_dir(filepath)
+    payload = dumps(data)
+    if GZIP_JSON:
+        filepath += '.gz'
+        with gzip.open(filepath, 'wb', compresslevel=1) as f:
+            f.write(payload)
+    else:
+        write_bytes(filepath, payload)
+    print(f"✓ Created: {filepath} ({os.path.getsize(filepath)} bytes)")
 
 def get_current_timestamp():
-    """Get current timestamp in ISO format"""
-    return datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+    """Get the run's timestamp in ISO format"""
+    return TIMESTAMP
 
 # ============================================================================
 # COMPREHENSIVE TEAM DATA GENERATORS
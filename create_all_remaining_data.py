@@ -5,120 +5,86 @@ Complete Data Generator - Creates ALL remaining leagues, players, and stadium da
 This script generates realistic, comprehensive football data for the FootyBot project
 """
 
-import json
+import gzip
 import os
-from datetime import datetime
 import random
 
+from footybot_json import GZIP_JSON, TIMESTAMP, dumps, ensure_dir, write_bytes
+from footybot_teams import create_team, load_seed_teams
+
 def save_json(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    ensure_dir(path)
+    payload = dumps(data)
+    if GZIP_JSON:
+        path += '.gz'
+        with gzip.open(path, 'wb', compresslevel=1) as f:
+            f.write(payload)
+    else:
+        write_bytes(path, payload)
     return path
 
-timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-# Helper function to create team templates
-def create_team(id, name, name_ar, code, logo_id, founded, stadium_name, stadium_ar, capacity, city, city_ar, nickname, nickname_ar, color1, color2, titles, cups, euro):
+# Helper function to stamp out generated filler teams from a per-league
+# template: colours, trophies and city are shared, only numbered fields change
+def create_filler_team(template, id, name, name_ar, code, founded, stadium_name, stadium_ar, capacity, nickname, nickname_ar):
     return {
+        **template,
         "id": id,
         "name": name,
         "name_ar": name_ar,
         "code": code,
-        "logo": f"https://media.api-sports.io/football/teams/{logo_id}.png",
+        "logo": f"https://media.api-sports.io/football/teams/{id}.png",
         "founded": founded,
-        "stadium": {
-            "name": stadium_name,
-            "name_ar": stadium_ar,
-            "capacity": capacity,
-            "city": city,
-            "city_ar": city_ar
-        },
+        "stadium": {**template["stadium"], "name": stadium_name, "name_ar": stadium_ar, "capacity": capacity},
         "nickname": nickname,
-        "nickname_ar": nickname_ar,
-        "colors": {"primary": color1, "secondary": color2},
-        "trophies": {
-            "league_titles": titles,
-            "domestic_cups": cups,
-            "european_cups": euro
-        }
+        "nickname_ar": nickname_ar
     }
 
-print("=" * 70)
-print("🏆 COMPLETE FOOTBALL DATA GENERATOR")
-print("=" * 70)
-print("Creating ALL remaining data files...")
-print()
+# Team ids handed out so far, so a filler range that runs into a real
+# team (in this league or an earlier one) fails the build
+ID_POOL = set()
+
+def check_team_ids(league, teams):
+    ids = {team["id"] for team in teams}
+    if len(ids) != len(teams):
+        raise ValueError(f"duplicate team id in {league}")
+    clash = ids & ID_POOL
+    if clash:
+        raise ValueError(f"team ids {sorted(clash)} in {league} are already used by another league")
+    ID_POOL.update(ids)
+
+# Helper function to wrap a team list in the standard league file layout
+def make_league(id, name, name_ar, country, country_ar, teams, season="2024-2025"):
+    check_team_ids(name, teams)
+    return {
+        "league": {
+            "id": id,
+            "name": name,
+            "name_ar": name_ar,
+            "country": country,
+            "country_ar": country_ar,
+            "logo": f"https://media.api-sports.io/football/leagues/{id}.png",
+            "season": season
+        },
+        "teams": teams,
+        "total_teams": len(teams),
+        "last_updated": TIMESTAMP
+    }
 
-files_created = []
+seed_teams = load_seed_teams(("eredivisie", "portuguese_league", "belgian_league", "scottish_league"))
 
 # ============================================================================
 # EUROPEAN LEAGUES
 # ============================================================================
 
 # Eredivisie (Dutch League - 18 teams)
-eredivisie_teams = [
-    create_team(194, "Ajax", "أياكس", "AJA", 194, 1900, "Johan Cruyff Arena", "يوهان كرويف أرينا", 54990, "Amsterdam", "أمستردام", "De Godenzonen", "أبناء الآلهة", "Red", "White", 36, 20, 4),
-    create_team(188, "PSV Eindhoven", "آيندهوفن", "PSV", 188, 1913, "Philips Stadion", "فيليبس ستاديون", 35000, "Eindhoven", "آيندهوفن", "Boeren", "الفلاحون", "Red", "White", 24, 10, 1),
-    create_team(203, "Feyenoord", "فينورد", "FEY", 203, 1908, "De Kuip", "دي كويب", 51117, "Rotterdam", "روتردام", "De Club aan de Maas", "نادي الماس", "Red", "White", 15, 13, 1),
-    create_team(201, "AZ Alkmaar", "ألكمار", "AZA", 201, 1967, "AFAS Stadion", "أفاس ستاديون", 19500, "Alkmaar", "ألكمار", "Kaaskoppen", "رؤوس الجبن", "Red", "White", 2, 4, 0),
-    create_team(193, "FC Utrecht", "أوتريخت", "UTR", 193, 1970, "Stadion Galgenwaard", "غالغنفارد", 24426, "Utrecht", "أوتريخت", "Utreg", "أوتريخ", "Red", "White", 0, 3, 0),
-    create_team(204, "FC Twente", "توينتي", "TWE", 204, 1965, "De Grolsch Veste", "دي غرولش فيستي", 30205, "Enschede", "إنسخيده", "Tukkers", "التوكرز", "Red", "White", 1, 3, 0),
-    create_team(199, "Vitesse", "فيتيسه", "VIT", 199, 1892, "GelreDome", "جيلريدوم", 21248, "Arnhem", "أرنيم", "Vitas", "فيتاس", "Yellow", "Black", 0, 1, 0),
-    create_team(198, "FC Groningen", "خرونينجن", "GRO", 198, 1971, "Euroborg", "يوروبورغ", 22525, "Groningen", "خرونينجن", "Trots van het Noorden", "فخر الشمال", "Green", "White", 0, 0, 0),
-    create_team(189, "Go Ahead Eagles", "غو أهيد إيغلز", "GAE", 189, 1902, "De Adelaarshorst", "دي أديلارزهورست", 10400, "Deventer", "ديفينتير", "Eagles", "النسور", "Red", "Yellow", 4, 0, 0),
-    create_team(192, "Willem II", "ويليم الثاني", "WIL", 192, 1896, "Koning Willem II Stadion", "ويليم الثاني", 14700, "Tilburg", "تيلبورغ", "Tricolores", "الثلاثي", "Blue", "White", 3, 2, 0),
-    create_team(206, "Heracles Almelo", "هيراكليس", "HER", 206, 1903, "Erve Asito", "إرفي أسيتو", 13500, "Almelo", "ألميلو", "Heraclieden", "الهيراكليديون", "Black", "White", 0, 0, 0),
-    create_team(195, "Heerenveen", "هيرينفين", "HEE", 195, 1920, "Abe Lenstra Stadion", "آبي لينسترا", 27224, "Heerenveen", "هيرينفين", "Superfriezen", "السوبر فريزيون", "Blue", "White", 0, 0, 0),
-    create_team(191, "Sparta Rotterdam", "سبارتا روتردام", "SPA", 191, 1888, "Het Kasteel", "القلعة", 11026, "Rotterdam", "روتردام", "Kasteelheren", "أسياد القلعة", "Red", "White", 6, 3, 0),
-    create_team(196, "Fortuna Sittard", "فورتونا سيتارد", "FOR", 196, 1968, "Fortuna Sittard Stadion", "فورتونا سيتارد", 12500, "Sittard", "سيتارد", "De Fortunezen", "الفورتونيون", "Yellow", "Green", 0, 1, 0),
-    create_team(208, "NEC Nijmegen", "نيمخن", "NEC", 208, 1900, "Goffertstadion", "غوفيرتستاديون", 12500, "Nijmegen", "نيمخن", "De Clubvan de Duizend", "نادي الألف", "Green", "Black", 0, 0, 0),
-    create_team(202, "PEC Zwolle", "زفوله", "PEC", 202, 1910, "MAC³PARK Stadion", "ماك بارك", 14000, "Zwolle", "زفوله", "Blauwvingers", "الأصابع الزرقاء", "Blue", "White", 0, 0, 0),
-    create_team(197, "RKC Waalwijk", "فالفايك", "RKC", 197, 1940, "Mandemakers Stadion", "مانديماكرز", 7500, "Waalwijk", "فالفايك", "RKC", "آر كيه سي", "Yellow", "Blue", 0, 0, 0),
-    create_team(207, "Almere City", "ألميري سيتي", "ALM", 207, 2001, "Yanmar Stadion", "يانمار ستاديون", 4501, "Almere", "ألميري", "De Zwarte Schapen", "الخراف السوداء", "Black", "Green", 0, 0, 0)
-]
-
-eredivisie = {
-    "league": {"id": 88, "name": "Eredivisie", "name_ar": "الدوري الهولندي الممتاز", "country": "Netherlands", "country_ar": "هولندا", "logo": "https://media.api-sports.io/football/leagues/88.png", "season": "2024-2025"},
-    "teams": eredivisie_teams,
-    "total_teams": len(eredivisie_teams),
-    "last_updated": timestamp
-}
-
-files_created.append(save_json('data/teams/eredivisie.json', eredivisie))
+eredivisie_teams = seed_teams['eredivisie']
+
+eredivisie = make_league(88, "Eredivisie", "الدوري الهولندي الممتاز", "Netherlands", "هولندا", eredivisie_teams)
 
 # Portuguese League (18 teams)
-portuguese_teams = [
-    create_team(211, "Benfica", "بنفيكا", "BEN", 211, 1904, "Estádio da Luz", "دا لوز", 64642, "Lisbon", "لشبونة", "As Águias", "النسور", "Red", "White", 38, 26, 2),
-    create_team(212, "Porto", "بورتو", "POR", 212, 1893, "Estádio do Dragão", "دو دراغاو", 50033, "Porto", "بورتو", "Os Dragões", "التنانين", "Blue", "White", 30, 17, 2),
-    create_team(228, "Sporting CP", "سبورتينغ لشبونة", "SPO", 228, 1906, "Estádio José Alvalade", "جوزيه ألفالادي", 50095, "Lisbon", "لشبونة", "Os Leões", "الأسود", "Green", "White", 19, 17, 0),
-    create_team(231, "Braga", "براغا", "BRA", 231, 1921, "Estádio Municipal de Braga", "براغا البلدي", 30286, "Braga", "براغا", "Os Arsenalistas", "الأرسناليون", "Red", "White", 0, 3, 0),
-    create_team(236, "Vitória Guimarães", "فيتوريا غيماريش", "GUI", 236, 1922, "Estádio D. Afonso Henriques", "دوم أفونسو", 30029, "Guimarães", "غيماريش", "Os Vimaranenses", "الفيمارانيون", "White", "Black", 0, 1, 0),
-    create_team(238, "Moreirense", "مويرينسي", "MOR", 238, 1938, "Parque de Jogos Comendador Joaquim de Almeida Freitas", "بارك دي جوغوس", 9000, "Moreira de Cónegos", "مويريرا", "Cónegos", "الكونيغوس", "Green", "White", 0, 0, 0),
-    create_team(215, "Boavista", "بوافيشتا", "BOA", 215, 1903, "Estádio do Bessa", "دو بيسا", 28263, "Porto", "بورتو", "As Panteras", "النمور", "Black", "White", 1, 5, 0),
-    create_team(218, "Paços Ferreira", "باسوس فيريرا", "PAC", 218, 1950, "Estádio da Mata Real", "دا ماتا ريال", 9077, "Paços de Ferreira", "باسوس", "Os Castores", "القنادس", "Yellow", "Green", 0, 1, 0),
-    create_team(217, "Gil Vicente", "جيل فيسنتي", "GIL", 217, 1924, "Estádio Cidade de Barcelos", "سيداد دي بارسيلوس", 12504, "Barcelos", "بارسيلوس", "Os Galos", "الديوك", "Red", "Blue", 0, 0, 0),
-    create_team(237, "Famalicão", "فاماليكاو", "FAM", 237, 1931, "Estádio Municipal de Famalicão", "فاماليكاو البلدي", 5307, "Vila Nova de Famalicão", "فيلا نوفا", "Famalicenses", "الفاماليكون", "Blue", "White", 0, 0, 0),
-    create_team(227, "Rio Ave", "ريو آفي", "RIO", 227, 1939, "Estádio do Rio Ave FC", "ريو آفي", 12815, "Vila do Conde", "فيلا دو كوندي", "Rioavistas", "الريوافيستا", "Green", "White", 0, 0, 0),
-    create_team(234, "Santa Clara", "سانتا كلارا", "SCL", 234, 1921, "Estádio de São Miguel", "ساو ميغيل", 13277, "Ponta Delgada", "بونتا ديلغادا", "Açorianos", "الأزوريون", "Red", "White", 0, 0, 0),
-    create_team(240, "Arouca", "أروكا", "ARO", 240, 1951, "Estádio Municipal de Arouca", "أروكا البلدي", 5000, "Arouca", "أروكا", "Arouquenses", "الأروكيون", "Yellow", "Black", 0, 0, 0),
-    create_team(241, "Estoril", "إستوريل", "EST", 241, 1939, "Estádio António Coimbra da Mota", "أنطونيو كويمبرا", 8015, "Estoril", "إستوريل", "Canarinhos", "الكناري", "Yellow", "Blue", 0, 0, 0),
-    create_team(242, "Chaves", "شافيش", "CHA", 242, 1949, "Estádio Municipal de Chaves", "شافيش البلدي", 8000, "Chaves", "شافيش", "Flavienses", "الفلافيون", "Red", "Blue", 0, 0, 0),
-    create_team(243, "Portimonense", "بورتيمونينسي", "POR", 243, 1914, "Estádio Municipal de Portimão", "بورتيماو", 9544, "Portimão", "بورتيماو", "Portimao", "بورتيماو", "Black", "White", 0, 0, 0),
-    create_team(244, "Vizela", "فيزيلا", "VIZ", 244, 1939, "Estádio do Vizela FC", "فيزيلا", 6000, "Vizela", "فيزيلا", "Vizelenses", "الفيزيليون", "White", "Blue", 0, 0, 0),
-    create_team(245, "Casa Pia", "كازا بيا", "CAS", 245, 1920, "Estádio Pina Manique", "بينا مانيك", 2500, "Lisbon", "لشبونة", "Os Gansos", "الإوز", "Yellow", "Black", 0, 0, 0)
-]
-
-portuguese_league = {
-    "league": {"id": 94, "name": "Primeira Liga", "name_ar": "الدوري البرتغالي الممتاز", "country": "Portugal", "country_ar": "البرتغال", "logo": "https://media.api-sports.io/football/leagues/94.png", "season": "2024-2025"},
-    "teams": portuguese_teams,
-    "total_teams": len(portuguese_teams),
-    "last_updated": timestamp
-}
-
-files_created.append(save_json('data/teams/portuguese_league.json', portuguese_league))
-
-print(f"✓ Created European leagues (Eredivisie, Portuguese)")
+portuguese_teams = seed_teams['portuguese_league']
+
+portuguese_league = make_league(94, "Primeira Liga", "الدوري البرتغالي الممتاز", "Portugal", "البرتغال", portuguese_teams)
 
 # ============================================================================
 # REMAINING LEAGUES SUMMARY
@@ -128,47 +94,45 @@ print(f"✓ Created European leagues (Eredivisie, Portuguese)")
 # with realistic but generated data to meet the requirements
 
 # Belgian League
-belgian_teams = [
-    create_team(569, "Club Brugge", "كلوب بروج", "CLB", 569, 1891, "Jan Breydel Stadium", "يان برايديل", 29062, "Bruges", "بروج", "Blauw-Zwart", "الأزرق والأسود", "Blue", "Black", 18, 11, 0),
-    create_team(597, "Anderlecht", "أندرلخت", "AND", 597, 1908, "Lotto Park", "لوتو بارك", 22500, "Brussels", "بروكسل", "Paars-wit", "البنفسجي والأبيض", "Purple", "White", 34, 9, 0),
-    create_team(598, "Genk", "جينك", "GEN", 598, 1988, "Cegeka Arena", "سيجيكا أرينا", 24604, "Genk", "جينك", "Blauw-Wit", "الأزرق والأبيض", "Blue", "White", 4, 5, 0),
-]
+belgian_teams = seed_teams['belgian_league']
 # Add 15 more Belgian teams...
+belgian_template = create_team(0, "", "", "", 0, 0, "", "", 0, "Belgium", "بلجيكا", "", "", "Red", "White", 0, 0, 0)
 for i in range(15):
-    belgian_teams.append(create_team(600+i, f"Belgian Team {i+4}", f"فريق بلجيكي {i+4}", f"BEL{i+4}", 600+i, 1900+i, f"Stadium {i+4}", f"ملعب {i+4}", 15000+i*1000, "Belgium", "بلجيكا", f"Team {i+4}", f"فريق {i+4}", "Red", "White", 0, 0, 0))
-
-belgian_league = {
-    "league": {"id": 144, "name": "Jupiler Pro League", "name_ar": "الدوري البلجيكي الممتاز", "country": "Belgium", "country_ar": "بلجيكا", "logo": "https://media.api-sports.io/football/leagues/144.png", "season": "2024-2025"},
-    "teams": belgian_teams,
-    "total_teams": len(belgian_teams),
-    "last_updated": timestamp
-}
+    n = str(i+4)
+    belgian_teams.append(create_filler_team(belgian_template, 600+i, "Belgian Team " + n, "فريق بلجيكي " + n, "BEL" + n, 1900+i, "Stadium " + n, "ملعب " + n, 15000+i*1000, "Team " + n, "فريق " + n))
 
-files_created.append(save_json('data/teams/belgian_league.json', belgian_league))
+belgian_league = make_league(144, "Jupiler Pro League", "الدوري البلجيكي الممتاز", "Belgium", "بلجيكا", belgian_teams)
 
 # Scottish League (12 teams)
-scottish_teams = [
-    create_team(247, "Celtic", "سلتيك", "CEL", 247, 1887, "Celtic Park", "سلتيك بارك", 60411, "Glasgow", "غلاسكو", "The Bhoys", "الأولاد", "Green", "White", 53, 40, 1),
-    create_team(248, "Rangers", "رينجرز", "RAN", 248, 1872, "Ibrox Stadium", "إيبروكس", 50817, "Glasgow", "غلاسكو", "The Gers", "الجيرز", "Blue", "White", 55, 34, 0),
-    create_team(249, "Aberdeen", "أبردين", "ABE", 249, 1903, "Pittodrie Stadium", "بيتودري", 20866, "Aberdeen", "أبردين", "The Dons", "الدونز", "Red", "White", 4, 7, 0),
-]
+scottish_teams = seed_teams['scottish_league']
 # Add 9 more Scottish teams...
+scottish_template = create_team(0, "", "", "", 0, 0, "", "", 0, "Scotland", "اسكتلندا", "", "", "Blue", "White", 0, 0, 0)
 for i in range(9):
-    scottish_teams.append(create_team(250+i, f"Scottish Team {i+4}", f"فريق اسكتلندي {i+4}", f"SCO{i+4}", 250+i, 1900+i, f"Stadium {i+4}", f"ملعب {i+4}", 10000+i*1000, "Scotland", "اسكتلندا", f"Team {i+4}", f"فريق {i+4}", "Blue", "White", 0, 0, 0))
-
-scottish_league = {
-    "league": {"id": 179, "name": "Premiership", "name_ar": "الدوري الاسكتلندي الممتاز", "country": "Scotland", "country_ar": "اسكتلندا", "logo": "https://media.api-sports.io/football/leagues/179.png", "season": "2024-2025"},
-    "teams": scottish_teams,
-    "total_teams": len(scottish_teams),
-    "last_updated": timestamp
-}
-
-files_created.append(save_json('data/teams/scottish_league.json', scottish_league))
+    n = str(i+4)
+    scottish_teams.append(create_filler_team(scottish_template, 250+i, "Scottish Team " + n, "فريق اسكتلندي " + n, "SCO" + n, 1900+i, "Stadium " + n, "ملعب " + n, 10000+i*1000, "Team " + n, "فريق " + n))
 
-print(f"✓ Created Belgian and Scottish leagues")
+scottish_league = make_league(179, "Premiership", "الدوري الاسكتلندي الممتاز", "Scotland", "اسكتلندا", scottish_teams)
 
 # Continue creating remaining leagues in similar fashion...
 # For brevity, I'll create template structures for all remaining leagues
 
-print(f"\n✅ Created {len(files_created)} team league files")
-print("=" * 70)
+def main():
+    print("=" * 70)
+    print("🏆 COMPLETE FOOTBALL DATA GENERATOR")
+    print("=" * 70)
+    print("Creating ALL remaining data files...")
+    print()
+
+    files_created = []
+    files_created.append(save_json('data/teams/eredivisie.json', eredivisie))
+    files_created.append(save_json('data/teams/portuguese_league.json', portuguese_league))
+    files_created.append(save_json('data/teams/belgian_league.json', belgian_league))
+    files_created.append(save_json('data/teams/scottish_league.json', scottish_league))
+
+    for path in files_created:
+        print(f"✓ {path}")
+    print(f"\n✅ Created {len(files_created)} team league files")
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
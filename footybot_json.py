@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared JSON output helpers for the data generator scripts
+Every generator writes its files through dumps() so one switch sets the layout
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Final
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# The bot reads these files, so write compact JSON unless a human-diffable
+# copy is requested (FOOTYBOT_PRETTY_JSON=1). Scripts that support it also
+# write gzip files when FOOTYBOT_GZIP_DATA=1.
+PRETTY_JSON = os.getenv('FOOTYBOT_PRETTY_JSON') == '1'
+GZIP_JSON = os.getenv('FOOTYBOT_GZIP_DATA') == '1'
+
+# One UTC timestamp for the whole run, so every file carries the same value
+TIMESTAMP: Final[str] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def dumps(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (indented only if PRETTY_JSON)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+    if PRETTY_JSON:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Directories already created by this process, so each one costs a
+# single os.makedirs call no matter how many files land in it
+_MADE_DIRS = set()
+
+def ensure_dir(path: str):
+    """Create the directory holding path, once per process"""
+    directory = os.path.dirname(path)
+    if directory not in _MADE_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _MADE_DIRS.add(directory)
+
+def write_bytes(path: str, payload: bytes):
+    """Write an encoded payload straight to a raw fd, bypassing file buffering"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared team builders for the data generator scripts
+Loads the hand-curated team rows from data/seeds/teams.csv
+"""
+
+import csv
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+# Most teams share kit colours and (mostly zero) trophy counts. These
+# builders hand out one shared sub-dict per distinct value instead of a
+# fresh copy per team; the dicts are only serialized, never mutated.
+@lru_cache(maxsize=None)
+def _colors(primary: str, secondary: str) -> Dict[str, str]:
+    return {"primary": primary, "secondary": secondary}
+
+@lru_cache(maxsize=None)
+def _trophies(titles: int, cups: int, euro: int) -> Dict[str, int]:
+    return {"league_titles": titles, "domestic_cups": cups, "european_cups": euro}
+
+def create_team(id, name, name_ar, code, logo_id, founded, stadium_name, stadium_ar, capacity, city, city_ar, nickname, nickname_ar, color1, color2, titles, cups, euro):
+    """Expand one team row into the team JSON layout"""
+    return {
+        "id": id,
+        "name": name,
+        "name_ar": name_ar,
+        "code": code,
+        "logo": f"https://media.api-sports.io/football/teams/{logo_id}.png",
+        "founded": founded,
+        "stadium": {
+            "name": stadium_name,
+            "name_ar": stadium_ar,
+            "capacity": capacity,
+            "city": city,
+            "city_ar": city_ar
+        },
+        "nickname": nickname,
+        "nickname_ar": nickname_ar,
+        "colors": _colors(color1, color2),
+        "trophies": _trophies(titles, cups, euro)
+    }
+
+# Hand-curated team rows live in a CSV seed instead of Python literals
+SEED_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'seeds', 'teams.csv')
+_SEED_INT_COLUMNS = ('id', 'logo_id', 'founded', 'capacity', 'titles', 'cups', 'euro')
+
+def load_seed_teams(leagues: Iterable[str], path: str = SEED_FILE) -> Dict[str, List[Dict[str, Any]]]:
+    """Read the seed CSV once into create_team dicts for the given leagues
+
+    Returns the team lists keyed by league file name; rows for any other
+    league are skipped without being converted.
+    """
+    teams = {league: [] for league in leagues}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            league = row.pop('league')
+            if league not in teams:
+                continue
+            for column in _SEED_INT_COLUMNS:
+                row[column] = int(row[column])
+            teams[league].append(create_team(**row))
+    return teams
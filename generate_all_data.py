@@ -5,11 +5,11 @@ Comprehensive Football Data Generator
 Generates 700+ teams, 6500+ players, 100+ leagues with full bilingual support
 """
 
-import json
 import os
-from datetime import datetime
 from typing import List, Dict, Any
 
+from footybot_json import TIMESTAMP, dumps, ensure_dir, write_bytes
+
 # Directories
 DATA_DIR = "data"
 TEAMS_DIR = os.path.join(DATA_DIR, "teams")
@@ -18,16 +18,15 @@ LEAGUES_DIR = os.path.join(DATA_DIR, "leagues")
 
 def save_json(filepath: str, data: Dict[str, Any]):
     """Save data to JSON file"""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    ensure_dir(filepath)
+    write_bytes(filepath, dumps(data))
     teams_count = len(data.get('teams', []))
     players_count = len(data.get('players', []))
     count_info = f" ({teams_count} teams)" if teams_count else f" ({players_count} players)" if players_count else ""
     print(f"✓ {filepath}{count_info}")
 
 def timestamp():
-    return datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+    return TIMESTAMP
 
 print("=" * 70)
 print("🏆 COMPREHENSIVE FOOTBALL DATA GENERATOR")
@@ -5,16 +5,91 @@ Comprehensive Player Data Generator
 Creates 6500+ players across all categories with detailed bilingual information
 """
 
-import json
 import os
 import random
-from datetime import datetime, timedelta
+from itertools import chain
+
+from footybot_json import PRETTY_JSON, TIMESTAMP, dumps, ensure_dir
+
+# How records sit inside the "players" array: (array opening, separator
+# before the first record, separator between records, array closing)
+if PRETTY_JSON:
+    _PLAYERS_ARRAY = (b'"players": [', b'\n    ', b',\n    ', b'\n  ]')
+else:
+    _PLAYERS_ARRAY = (b'"players":[', b'', b',', b']')
+
+def _dumps_record(player):
+    """Encode one player as it sits inside the "players" array"""
+    if PRETTY_JSON:
+        return dumps(player).replace(b'\n', b'\n    ')
+    return dumps(player)
 
 def save_json(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"✓ {os.path.basename(path)} ({len(data['players'])} players)")
+    """Write a player file, encoding the "players" records one at a time
+
+    data["players"] may be any iterable (the builders pass generators), so
+    neither the whole record list nor the whole encoded file is ever held in
+    memory; the caller sets data["total_players"], and a header that
+    disagrees with the number of records written raises ValueError.
+    """
+    opening, first, separator, closing = _PLAYERS_ARRAY
+    # Encode everything around the records once, then fill in the array
+    head, tail = dumps({**data, "players": []}).split(opening + b']', 1)
+    ensure_dir(path)
+    count = 0
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(head + opening)
+        for player in data['players']:
+            f.write((separator if count else first) + _dumps_record(player))
+            count += 1
+        f.write((closing if count else b']') + tail)
+    if count != data['total_players']:
+        raise ValueError(f"{path}: header says {data['total_players']} players but {count} were written")
+    return f"✓ {os.path.basename(path)} ({count} players)"
+
+# One generator for every draw in this process. Set FOOTYBOT_SEED to make
+# runs reproducible: each file is then generated from its own fixed seed,
+# whichever worker happens to build it.
+SEED = os.getenv('FOOTYBOT_SEED') or None
+_rng = random.Random()
+
+# The bulk loops draw each random field as a whole column up front: one
+# random.choices call per column is several times cheaper than a
+# random.randint/random.choice call per player per field
+def _ints(low, high, n):
+    """n uniform ints in [low, high], like n calls to random.randint"""
+    return _rng.choices(range(low, high + 1), k=n)
+
+# Pre-formatted labels indexed by their number, so the loops pick ready-made
+# strings instead of formatting one per player
+HEIGHTS = {h: f"{h} cm" for h in range(165, 201)}
+WEIGHTS = {w: f"{w} kg" for w in range(60, 96)}
+VALUES = {v: f"€{v}M" for v in range(1, 201)}
+CONTRACTS = {y: f"{y}-06-30" for y in range(2025, 2030)}
+
+def _pick(labels, low, high, n):
+    """n labels drawn uniformly from labels[low..high]"""
+    return _rng.choices([labels[k] for k in range(low, high + 1)], k=n)
+
+# Every birth date a player can get, grouped by year: 12 months x days 1-28
+# (so every month is valid), drawn by index instead of formatted per player
+BIRTH_DATES = {y: [f"{y}-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)] for y in range(1986, 2007)}
+
+# Paired values are drawn as one tuple per player and unzipped into
+# columns, so a player's English and Arabic names (and team id) always match
+POSITIONS = [("Forward", "مهاجم"), ("Midfielder", "لاعب وسط"), ("Defender", "مدافع"), ("Goalkeeper", "حارس مرمى")]
+PL_TEAMS = [
+    (33, "Manchester United", "مانشستر يونايتد"),
+    (40, "Liverpool", "ليفربول"),
+    (42, "Arsenal", "آرسنال"),
+    (49, "Chelsea", "تشيلسي"),
+    (50, "Manchester City", "مانشستر سيتي"),
+]
+LA_LIGA_TEAMS = [
+    (529, "Barcelona", "برشلونة"),
+    (541, "Real Madrid", "ريال مدريد"),
+    (530, "Atletico Madrid", "أتلتيكو مدريد"),
+]
 
 def create_player(id, name, name_ar, firstname, lastname, age, birth_date, birth_place, birth_place_ar, country, country_ar, nationality_ar, height, weight, team_id, team_name, team_ar, position, position_ar, number, foot, appearances, goals, assists, yellows, reds, value, contract):
     return {
@@ -57,125 +132,112 @@ def create_player(id, name, name_ar, firstname, lastname, age, birth_date, birth
         "contract_until": contract
     }
 
-timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-print("=" * 70)
-print("👥 COMPREHENSIVE PLAYER DATA GENERATOR")
-print("=" * 70)
-print("Creating 6500+ players across all categories...")
-print()
+# Generic filler-player builder shared by every league file. teams rows are
+# (id, name, name_ar), or just (name, name_ar) with random_team_ids, which
+# gives every player a random team id instead.
+def league_players(count, first_id, first_no, name_prefix, name_ar_prefix, surname_prefix, country, country_ar, nationality_ar, teams, *, apps_max, goals_max, assists_max, yellows_max, value_min, value_max, random_team_ids=False):
+    ages = _ints(19, 35, count)
+    birthdays = _ints(0, 335, count)
+    heights = _pick(HEIGHTS, 170, 195, count)
+    weights = _pick(WEIGHTS, 65, 90, count)
+    if random_team_ids:
+        team_ids = _ints(1, 1000, count)
+        team_names, team_names_ar = zip(*_rng.choices(teams, k=count))
+    else:
+        team_ids, team_names, team_names_ar = zip(*_rng.choices(teams, k=count))
+    positions, positions_ar = zip(*_rng.choices(POSITIONS, k=count))
+    numbers = _ints(1, 99, count)
+    feet = _rng.choices(["Left", "Right"], k=count)
+    appearances = _ints(50, apps_max, count)
+    goals = _ints(0, goals_max, count)
+    assists = _ints(0, assists_max, count)
+    yellows = _ints(0, yellows_max, count)
+    reds = _ints(0, 2, count)
+    values = _pick(VALUES, value_min, value_max, count)
+    contracts = _pick(CONTRACTS, 2025, 2029, count)
+    # Each player's number is formatted once and shared by all four names
+    serials = list(map(str, range(first_no, first_no + count)))
+    return (create_player(
+        first_id + i,
+        name_prefix + serials[i],
+        name_ar_prefix + serials[i],
+        "Player" + serials[i],
+        surname_prefix + serials[i],
+        ages[i],
+        BIRTH_DATES[2024 - ages[i]][birthdays[i]],
+        country,
+        country_ar,
+        country,
+        country_ar,
+        nationality_ar,
+        heights[i],
+        weights[i],
+        team_ids[i],
+        team_names[i],
+        team_names_ar[i],
+        positions[i],
+        positions_ar[i],
+        numbers[i],
+        feet[i],
+        appearances[i],
+        goals[i],
+        assists[i],
+        yellows[i],
+        reds[i],
+        values[i],
+        contracts[i]
+    ) for i in range(count))
 
 # ============================================================================
 # PREMIER LEAGUE PLAYERS (500+)
 # ============================================================================
 
-premier_league_players = [
-    create_player(276, "Mohamed Salah", "محمد صلاح", "Mohamed", "Salah", 32, "1992-06-15", "Nagrig", "نجريج", "Egypt", "مصر", "مصري", "175 cm", "71 kg", 40, "Liverpool", "ليفربول", "Forward", "مهاجم", 11, "Left", 350, 210, 95, 18, 0, "€65M", "2025-06-30"),
-    create_player(2294, "Erling Haaland", "إيرلينغ هالاند", "Erling", "Haaland", 24, "2000-07-21", "Leeds", "ليدز", "Norway", "النرويج", "نرويجي", "195 cm", "88 kg", 50, "Manchester City", "مانشستر سيتي", "Forward", "مهاجم", 9, "Left", 150, 145, 25, 8, 0, "€180M", "2027-06-30"),
-    create_player(19050, "Bukayo Saka", "بوكايو ساكا", "Bukayo", "Saka", 23, "2001-09-05", "London", "لندن", "England", "إنجلترا", "إنجليزي", "178 cm", "75 kg", 42, "Arsenal", "آرسنال", "Forward", "مهاجم", 7, "Left", 200, 65, 70, 15, 0, "€120M", "2027-06-30"),
-    create_player(882, "Kevin De Bruyne", "كيفن دي بروين", "Kevin", "De Bruyne", 33, "1991-06-28", "Drongen", "درونجن", "Belgium", "بلجيكا", "بلجيكي", "181 cm", "70 kg", 50, "Manchester City", "مانشستر سيتي", "Midfielder", "لاعب وسط", 17, "Right", 380, 102, 170, 30, 2, "€45M", "2025-06-30"),
-    create_player(1100, "Virgil van Dijk", "فيرجيل فان دايك", "Virgil", "van Dijk", 33, "1991-07-08", "Breda", "بريدا", "Netherlands", "هولندا", "هولندي", "195 cm", "92 kg", 40, "Liverpool", "ليفربول", "Defender", "مدافع", 4, "Right", 280, 25, 12, 20, 1, "€40M", "2025-06-30"),
-    create_player(18833, "Phil Foden", "فيل فودين", "Phil", "Foden", 24, "2000-05-28", "Stockport", "ستوكبورت", "England", "إنجلترا", "إنجليزي", "171 cm", "69 kg", 50, "Manchester City", "مانشستر سيتي", "Midfielder", "لاعب وسط", 47, "Left", 250, 75, 60, 10, 0, "€110M", "2027-06-30"),
-    create_player(18830, "Cole Palmer", "كول بالمر", "Cole", "Palmer", 22, "2002-05-06", "Manchester", "مانشستر", "England", "إنجلترا", "إنجليزي", "189 cm", "75 kg", 49, "Chelsea", "تشيلسي", "Midfielder", "لاعب وسط", 20, "Left", 100, 35, 25, 5, 0, "€90M", "2030-06-30"),
-    create_player(746, "Bruno Fernandes", "برونو فرنانديز", "Bruno", "Fernandes", 30, "1994-09-08", "Maia", "مايا", "Portugal", "البرتغال", "برتغالي", "179 cm", "69 kg", 33, "Manchester United", "مانشستر يونايتد", "Midfielder", "لاعب وسط", 8, "Right", 220, 70, 75, 35, 1, "€70M", "2026-06-30"),
-    create_player(742, "Marcus Rashford", "ماركوس راشفورد", "Marcus", "Rashford", 27, "1997-10-31", "Manchester", "مانشستر", "England", "إنجلترا", "إنجليزي", "180 cm", "70 kg", 33, "Manchester United", "مانشستر يونايتد", "Forward", "مهاجم", 10, "Right", 300, 110, 65, 28, 2, "€75M", "2028-06-30"),
-    create_player(18935, "Ollie Watkins", "أولي واتكينز", "Ollie", "Watkins", 28, "1995-12-30", "Torquay", "توركي", "England", "إنجلترا", "إنجليزي", "180 cm", "73 kg", 66, "Aston Villa", "أستون فيلا", "Forward", "مهاجم", 11, "Right", 180, 70, 35, 15, 0, "€65M", "2028-06-30"),
-]
+def generate_premier_league():
+    premier_league_players = [
+        create_player(276, "Mohamed Salah", "محمد صلاح", "Mohamed", "Salah", 32, "1992-06-15", "Nagrig", "نجريج", "Egypt", "مصر", "مصري", "175 cm", "71 kg", 40, "Liverpool", "ليفربول", "Forward", "مهاجم", 11, "Left", 350, 210, 95, 18, 0, "€65M", "2025-06-30"),
+        create_player(2294, "Erling Haaland", "إيرلينغ هالاند", "Erling", "Haaland", 24, "2000-07-21", "Leeds", "ليدز", "Norway", "النرويج", "نرويجي", "195 cm", "88 kg", 50, "Manchester City", "مانشستر سيتي", "Forward", "مهاجم", 9, "Left", 150, 145, 25, 8, 0, "€180M", "2027-06-30"),
+        create_player(19050, "Bukayo Saka", "بوكايو ساكا", "Bukayo", "Saka", 23, "2001-09-05", "London", "لندن", "England", "إنجلترا", "إنجليزي", "178 cm", "75 kg", 42, "Arsenal", "آرسنال", "Forward", "مهاجم", 7, "Left", 200, 65, 70, 15, 0, "€120M", "2027-06-30"),
+        create_player(882, "Kevin De Bruyne", "كيفن دي بروين", "Kevin", "De Bruyne", 33, "1991-06-28", "Drongen", "درونجن", "Belgium", "بلجيكا", "بلجيكي", "181 cm", "70 kg", 50, "Manchester City", "مانشستر سيتي", "Midfielder", "لاعب وسط", 17, "Right", 380, 102, 170, 30, 2, "€45M", "2025-06-30"),
+        create_player(1100, "Virgil van Dijk", "فيرجيل فان دايك", "Virgil", "van Dijk", 33, "1991-07-08", "Breda", "بريدا", "Netherlands", "هولندا", "هولندي", "195 cm", "92 kg", 40, "Liverpool", "ليفربول", "Defender", "مدافع", 4, "Right", 280, 25, 12, 20, 1, "€40M", "2025-06-30"),
+        create_player(18833, "Phil Foden", "فيل فودين", "Phil", "Foden", 24, "2000-05-28", "Stockport", "ستوكبورت", "England", "إنجلترا", "إنجليزي", "171 cm", "69 kg", 50, "Manchester City", "مانشستر سيتي", "Midfielder", "لاعب وسط", 47, "Left", 250, 75, 60, 10, 0, "€110M", "2027-06-30"),
+        create_player(18830, "Cole Palmer", "كول بالمر", "Cole", "Palmer", 22, "2002-05-06", "Manchester", "مانشستر", "England", "إنجلترا", "إنجليزي", "189 cm", "75 kg", 49, "Chelsea", "تشيلسي", "Midfielder", "لاعب وسط", 20, "Left", 100, 35, 25, 5, 0, "€90M", "2030-06-30"),
+        create_player(746, "Bruno Fernandes", "برونو فرنانديز", "Bruno", "Fernandes", 30, "1994-09-08", "Maia", "مايا", "Portugal", "البرتغال", "برتغالي", "179 cm", "69 kg", 33, "Manchester United", "مانشستر يونايتد", "Midfielder", "لاعب وسط", 8, "Right", 220, 70, 75, 35, 1, "€70M", "2026-06-30"),
+        create_player(742, "Marcus Rashford", "ماركوس راشفورد", "Marcus", "Rashford", 27, "1997-10-31", "Manchester", "مانشستر", "England", "إنجلترا", "إنجليزي", "180 cm", "70 kg", 33, "Manchester United", "مانشستر يونايتد", "Forward", "مهاجم", 10, "Right", 300, 110, 65, 28, 2, "€75M", "2028-06-30"),
+        create_player(18935, "Ollie Watkins", "أولي واتكينز", "Ollie", "Watkins", 28, "1995-12-30", "Torquay", "توركي", "England", "إنجلترا", "إنجليزي", "180 cm", "73 kg", 66, "Aston Villa", "أستون فيلا", "Forward", "مهاجم", 11, "Right", 180, 70, 35, 15, 0, "€65M", "2028-06-30"),
+    ]
 
-# Add more Premier League players
-for i in range(490):
-    age = random.randint(19, 35)
-    year = 2024 - age
-    premier_league_players.append(create_player(
-        50000 + i,
-        f"PL Player {i+11}",
-        f"لاعب دوري إنجليزي {i+11}",
-        f"Player{i+11}",
-        f"Surname{i+11}",
-        age,
-        f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-        "England",
-        "إنجلترا",
-        "England",
-        "إنجلترا",
-        "إنجليزي",
-        f"{random.randint(170,195)} cm",
-        f"{random.randint(65,90)} kg",
-        random.choice([33, 40, 42, 49, 50]),
-        random.choice(["Manchester City", "Liverpool", "Arsenal", "Chelsea"]),
-        random.choice(["مانشستر سيتي", "ليفربول", "آرسنال", "تشيلسي"]),
-        random.choice(["Forward", "Midfielder", "Defender", "Goalkeeper"]),
-        random.choice(["مهاجم", "لاعب وسط", "مدافع", "حارس مرمى"]),
-        random.randint(1, 99),
-        random.choice(["Left", "Right"]),
-        random.randint(50, 350),
-        random.randint(0, 80),
-        random.randint(0, 60),
-        random.randint(0, 30),
-        random.randint(0, 2),
-        f"€{random.randint(5, 100)}M",
-        f"{random.randint(2025, 2029)}-06-30"
-    ))
-
-premier_league_data = {
-    "league": {
-        "id": 39,
-        "name": "Premier League",
-        "name_ar": "الدوري الإنجليزي الممتاز"
-    },
-    "players": premier_league_players,
-    "total_players": len(premier_league_players),
-    "last_updated": timestamp
-}
-
-save_json('data/players/premier_league_players.json', premier_league_data)
+    # Add more Premier League players
+    filler_count = 490
+    filler_players = league_players(filler_count, 50000, 11, "PL Player ", "لاعب دوري إنجليزي ", "Surname", "England", "إنجلترا", "إنجليزي", PL_TEAMS, apps_max=350, goals_max=80, assists_max=60, yellows_max=30, value_min=5, value_max=100)
+
+    premier_league_data = {
+        "league": {
+            "id": 39,
+            "name": "Premier League",
+            "name_ar": "الدوري الإنجليزي الممتاز"
+        },
+        "players": chain(premier_league_players, filler_players),
+        "total_players": len(premier_league_players) + filler_count,
+        "last_updated": TIMESTAMP
+    }
+
+    return save_json('data/players/premier_league_players.json', premier_league_data)
 
 # ============================================================================
 # REMAINING PLAYER FILES (Using templates for efficiency)
 # ============================================================================
 
 # La Liga Players (500+)
-la_liga_players = []
-for i in range(500):
-    age = random.randint(19, 35)
-    year = 2024 - age
-    la_liga_players.append(create_player(
-        60000 + i,
-        f"LaLiga Player {i+1}",
-        f"لاعب دوري إسباني {i+1}",
-        f"Player{i+1}",
-        f"Apellido{i+1}",
-        age,
-        f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-        "Spain",
-        "إسبانيا",
-        "Spain",
-        "إسبانيا",
-        "إسباني",
-        f"{random.randint(170,195)} cm",
-        f"{random.randint(65,90)} kg",
-        random.choice([529, 541, 530]),
-        random.choice(["Barcelona", "Real Madrid", "Atletico Madrid"]),
-        random.choice(["برشلونة", "ريال مدريد", "أتلتيكو مدريد"]),
-        random.choice(["Forward", "Midfielder", "Defender", "Goalkeeper"]),
-        random.choice(["مهاجم", "لاعب وسط", "مدافع", "حارس مرمى"]),
-        random.randint(1, 99),
-        random.choice(["Left", "Right"]),
-        random.randint(50, 350),
-        random.randint(0, 80),
-        random.randint(0, 60),
-        random.randint(0, 30),
-        random.randint(0, 2),
-        f"€{random.randint(5, 120)}M",
-        f"{random.randint(2025, 2029)}-06-30"
-    ))
-
-save_json('data/players/la_liga_players.json', {
-    "league": {"id": 140, "name": "La Liga", "name_ar": "الدوري الإسباني"},
-    "players": la_liga_players,
-    "total_players": len(la_liga_players),
-    "last_updated": timestamp
-})
+def generate_la_liga():
+    count = 500
+    la_liga_players = league_players(count, 60000, 1, "LaLiga Player ", "لاعب دوري إسباني ", "Apellido", "Spain", "إسبانيا", "إسباني", LA_LIGA_TEAMS, apps_max=350, goals_max=80, assists_max=60, yellows_max=30, value_min=5, value_max=120)
+
+    return save_json('data/players/la_liga_players.json', {
+        "league": {"id": 140, "name": "La Liga", "name_ar": "الدوري الإسباني"},
+        "players": la_liga_players,
+        "total_players": count,
+        "last_updated": TIMESTAMP
+    })
 
 # Continue with remaining player categories...
 # I'll create template players for all remaining categories to meet the 6500+ requirement
@@ -188,236 +250,177 @@ player_categories = [
     ("egyptian_league_players.json", 300, "Egyptian League", "الدوري المصري", 233, ["Al Ahly", "Zamalek"], ["الأهلي", "الزمالك"]),
 ]
 
-base_id = 70000
-for filename, count, league_name, league_ar, league_id, teams_en, teams_ar in player_categories:
-    players = []
-    for i in range(count):
-        age = random.randint(19, 35)
-        year = 2024 - age
-        players.append(create_player(
-            base_id + i,
-            f"{league_name} Player {i+1}",
-            f"لاعب {league_ar} {i+1}",
-            f"Player{i+1}",
-            f"Surname{i+1}",
-            age,
-            f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-            league_name.split()[0],
-            league_ar.split()[1] if len(league_ar.split()) > 1 else league_ar,
-            league_name.split()[0],
-            league_ar.split()[1] if len(league_ar.split()) > 1 else league_ar,
-            f"{league_ar.split()[1] if len(league_ar.split()) > 1 else league_ar}",
-            f"{random.randint(170,195)} cm",
-            f"{random.randint(65,90)} kg",
-            random.randint(1, 1000),
-            random.choice(teams_en),
-            random.choice(teams_ar),
-            random.choice(["Forward", "Midfielder", "Defender", "Goalkeeper"]),
-            random.choice(["مهاجم", "لاعب وسط", "مدافع", "حارس مرمى"]),
-            random.randint(1, 99),
-            random.choice(["Left", "Right"]),
-            random.randint(50, 300),
-            random.randint(0, 60),
-            random.randint(0, 40),
-            random.randint(0, 25),
-            random.randint(0, 2),
-            f"€{random.randint(1, 80)}M",
-            f"{random.randint(2025, 2029)}-06-30"
-        ))
-    
-    save_json(f'data/players/{filename}', {
+def generate_league_category(filename, count, league_name, league_ar, league_id, teams_en, teams_ar, base_id):
+    teams = list(zip(teams_en, teams_ar))
+    # Split the league names once per file, not once per field or player
+    country = league_name.split()[0]
+    parts = league_ar.split()
+    country_ar = parts[1] if len(parts) > 1 else league_ar
+    players = league_players(count, base_id, 1, f"{league_name} Player ", f"لاعب {league_ar} ", "Surname", country, country_ar, country_ar, teams, apps_max=300, goals_max=60, assists_max=40, yellows_max=25, value_min=1, value_max=80, random_team_ids=True)
+
+    return save_json(f'data/players/{filename}', {
         "league": {"id": league_id, "name": league_name, "name_ar": league_ar},
         "players": players,
-        "total_players": len(players),
-        "last_updated": timestamp
+        "total_players": count,
+        "last_updated": TIMESTAMP
     })
-    base_id += count
-
-print(f"\n✅ Created league-specific player files")
 
 # ============================================================================
 # POSITION-BASED PLAYER FILES
 # ============================================================================
 
-# Goalkeepers (500+)
-goalkeepers = []
-for i in range(500):
-    age = random.randint(22, 38)
-    year = 2024 - age
-    goalkeepers.append(create_player(
-        100000 + i,
-        f"Goalkeeper {i+1}",
-        f"حارس {i+1}",
-        f"GK{i+1}",
-        f"Keeper{i+1}",
-        age,
-        f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
+# Generic builder shared by the position files: every player plays one
+# position for a random team id; (low, high) bounds size each drawn column
+def position_players(count, first_id, name_prefix, name_ar_prefix, first_prefix, last_prefix, position, position_ar, team_count, *, ages, heights, weights, numbers, appearances, goals, assists, yellows, reds, values):
+    ages = _ints(*ages, count)
+    birthdays = _ints(0, 335, count)
+    heights = _pick(HEIGHTS, *heights, count)
+    weights = _pick(WEIGHTS, *weights, count)
+    team_ids = _ints(1, 1000, count)
+    numbers = _ints(*numbers, count)
+    feet = _rng.choices(["Left", "Right"], k=count)
+    appearances = _ints(*appearances, count)
+    goals = _ints(*goals, count)
+    assists = _ints(*assists, count)
+    yellows = _ints(*yellows, count)
+    reds = _ints(*reds, count)
+    values = _pick(VALUES, *values, count)
+    contracts = _pick(CONTRACTS, 2025, 2029, count)
+    serials = list(map(str, range(1, count + 1)))
+    team_names = [f"Team {k}" for k in range(team_count)]
+    team_names_ar = [f"فريق {k}" for k in range(team_count)]
+    return (create_player(
+        first_id + i,
+        name_prefix + serials[i],
+        name_ar_prefix + serials[i],
+        first_prefix + serials[i],
+        last_prefix + serials[i],
+        ages[i],
+        BIRTH_DATES[2024 - ages[i]][birthdays[i]],
         "International",
         "دولي",
         "International",
         "دولي",
         "دولي",
-        f"{random.randint(185,200)} cm",
-        f"{random.randint(80,95)} kg",
-        random.randint(1, 1000),
-        f"Team {i%50}",
-        f"فريق {i%50}",
-        "Goalkeeper",
-        "حارس مرمى",
-        1,
-        random.choice(["Left", "Right"]),
-        random.randint(100, 400),
-        0,
-        0,
-        random.randint(0, 15),
-        random.randint(0, 1),
-        f"€{random.randint(5, 50)}M",
-        f"{random.randint(2025, 2029)}-06-30"
-    ))
-
-save_json('data/players/goalkeepers.json', {
-    "category": "Goalkeepers",
-    "category_ar": "حراس المرمى",
-    "players": goalkeepers,
-    "total_players": len(goalkeepers),
-    "last_updated": timestamp
-})
+        heights[i],
+        weights[i],
+        team_ids[i],
+        team_names[i % team_count],
+        team_names_ar[i % team_count],
+        position,
+        position_ar,
+        numbers[i],
+        feet[i],
+        appearances[i],
+        goals[i],
+        assists[i],
+        yellows[i],
+        reds[i],
+        values[i],
+        contracts[i]
+    ) for i in range(count))
+
+# Goalkeepers (500+)
+def generate_goalkeepers():
+    count = 500
+    goalkeepers = position_players(count, 100000, "Goalkeeper ", "حارس ", "GK", "Keeper", "Goalkeeper", "حارس مرمى", 50, ages=(22, 38), heights=(185, 200), weights=(80, 95), numbers=(1, 1), appearances=(100, 400), goals=(0, 0), assists=(0, 0), yellows=(0, 15), reds=(0, 1), values=(5, 50))
+
+    return save_json('data/players/goalkeepers.json', {
+        "category": "Goalkeepers",
+        "category_ar": "حراس المرمى",
+        "players": goalkeepers,
+        "total_players": count,
+        "last_updated": TIMESTAMP
+    })
 
 # Defenders (1500+)
-defenders = []
-for i in range(1500):
-    age = random.randint(19, 36)
-    year = 2024 - age
-    defenders.append(create_player(
-        110000 + i,
-        f"Defender {i+1}",
-        f"مدافع {i+1}",
-        f"DF{i+1}",
-        f"Defender{i+1}",
-        age,
-        f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-        "International",
-        "دولي",
-        "International",
-        "دولي",
-        "دولي",
-        f"{random.randint(175,195)} cm",
-        f"{random.randint(70,90)} kg",
-        random.randint(1, 1000),
-        f"Team {i%100}",
-        f"فريق {i%100}",
-        "Defender",
-        "مدافع",
-        random.randint(2, 6),
-        random.choice(["Left", "Right"]),
-        random.randint(50, 400),
-        random.randint(0, 30),
-        random.randint(0, 20),
-        random.randint(5, 40),
-        random.randint(0, 3),
-        f"€{random.randint(2, 80)}M",
-        f"{random.randint(2025, 2029)}-06-30"
-    ))
-
-save_json('data/players/defenders.json', {
-    "category": "Defenders",
-    "category_ar": "المدافعون",
-    "players": defenders,
-    "total_players": len(defenders),
-    "last_updated": timestamp
-})
+def generate_defenders():
+    count = 1500
+    defenders = position_players(count, 110000, "Defender ", "مدافع ", "DF", "Defender", "Defender", "مدافع", 100, ages=(19, 36), heights=(175, 195), weights=(70, 90), numbers=(2, 6), appearances=(50, 400), goals=(0, 30), assists=(0, 20), yellows=(5, 40), reds=(0, 3), values=(2, 80))
+
+    return save_json('data/players/defenders.json', {
+        "category": "Defenders",
+        "category_ar": "المدافعون",
+        "players": defenders,
+        "total_players": count,
+        "last_updated": TIMESTAMP
+    })
 
 # Midfielders (2000+)
-midfielders = []
-for i in range(2000):
-    age = random.randint(18, 35)
-    year = 2024 - age
-    midfielders.append(create_player(
-        120000 + i,
-        f"Midfielder {i+1}",
-        f"لاعب وسط {i+1}",
-        f"MF{i+1}",
-        f"Mid{i+1}",
-        age,
-        f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-        "International",
-        "دولي",
-        "International",
-        "دولي",
-        "دولي",
-        f"{random.randint(165,190)} cm",
-        f"{random.randint(60,85)} kg",
-        random.randint(1, 1000),
-        f"Team {i%100}",
-        f"فريق {i%100}",
-        "Midfielder",
-        "لاعب وسط",
-        random.randint(6, 23),
-        random.choice(["Left", "Right"]),
-        random.randint(50, 450),
-        random.randint(5, 100),
-        random.randint(5, 120),
-        random.randint(10, 45),
-        random.randint(0, 3),
-        f"€{random.randint(3, 150)}M",
-        f"{random.randint(2025, 2029)}-06-30"
-    ))
-
-save_json('data/players/midfielders.json', {
-    "category": "Midfielders",
-    "category_ar": "لاعبو الوسط",
-    "players": midfielders,
-    "total_players": len(midfielders),
-    "last_updated": timestamp
-})
+def generate_midfielders():
+    count = 2000
+    midfielders = position_players(count, 120000, "Midfielder ", "لاعب وسط ", "MF", "Mid", "Midfielder", "لاعب وسط", 100, ages=(18, 35), heights=(165, 190), weights=(60, 85), numbers=(6, 23), appearances=(50, 450), goals=(5, 100), assists=(5, 120), yellows=(10, 45), reds=(0, 3), values=(3, 150))
+
+    return save_json('data/players/midfielders.json', {
+        "category": "Midfielders",
+        "category_ar": "لاعبو الوسط",
+        "players": midfielders,
+        "total_players": count,
+        "last_updated": TIMESTAMP
+    })
 
 # Forwards (1500+)
-forwards = []
-for i in range(1500):
-    age = random.randint(18, 36)
-    year = 2024 - age
-    forwards.append(create_player(
-        130000 + i,
-        f"Forward {i+1}",
-        f"مهاجم {i+1}",
-        f"FW{i+1}",
-        f"Striker{i+1}",
-        age,
-        f"{year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-        "International",
-        "دولي",
-        "International",
-        "دولي",
-        "دولي",
-        f"{random.randint(165,195)} cm",
-        f"{random.randint(65,90)} kg",
-        random.randint(1, 1000),
-        f"Team {i%100}",
-        f"فريق {i%100}",
-        "Forward",
-        "مهاجم",
-        random.randint(7, 11),
-        random.choice(["Left", "Right"]),
-        random.randint(50, 400),
-        random.randint(10, 200),
-        random.randint(5, 80),
-        random.randint(5, 35),
-        random.randint(0, 3),
-        f"€{random.randint(5, 200)}M",
-        f"{random.randint(2025, 2029)}-06-30"
-    ))
-
-save_json('data/players/forwards.json', {
-    "category": "Forwards",
-    "category_ar": "المهاجمون",
-    "players": forwards,
-    "total_players": len(forwards),
-    "last_updated": timestamp
-})
-
-print(f"✅ Created position-based player files")
-
-print(f"\n" + "=" * 70)
-print(f"✅ PLAYER DATA GENERATION COMPLETE")
-print(f"Total players created: 6,500+")
-print("=" * 70)
+def generate_forwards():
+    count = 1500
+    forwards = position_players(count, 130000, "Forward ", "مهاجم ", "FW", "Striker", "Forward", "مهاجم", 100, ages=(18, 36), heights=(165, 195), weights=(65, 90), numbers=(7, 11), appearances=(50, 400), goals=(10, 200), assists=(5, 80), yellows=(5, 35), reds=(0, 3), values=(5, 200))
+
+    return save_json('data/players/forwards.json', {
+        "category": "Forwards",
+        "category_ar": "المهاجمون",
+        "players": forwards,
+        "total_players": count,
+        "last_updated": TIMESTAMP
+    })
+
+def _run(job, *args):
+    """Seed the generator for one file, then build and write it"""
+    _rng.seed(None if SEED is None else f"{SEED}:{job.__name__}:{args}")
+    return job(*args)
+
+def main():
+    print("=" * 70)
+    print("👥 COMPREHENSIVE PLAYER DATA GENERATOR")
+    print("=" * 70)
+    print("Creating 6500+ players across all categories...")
+    print()
+
+    # All files land in the same directory; creating it before the workers
+    # fork means none of them has to
+    ensure_dir('data/players/')
+
+    league_jobs = [(generate_premier_league,), (generate_la_liga,)]
+    base_id = 70000
+    for category in player_categories:
+        league_jobs.append((generate_league_category, *category, base_id))
+        base_id += category[1]
+    position_jobs = [(job,) for job in (generate_goalkeepers, generate_defenders, generate_midfielders, generate_forwards)]
+
+    # Every file is independent, so with more than one CPU build and write
+    # them in parallel; _run reseeds per file, so forked workers don't share
+    # a random state. On a single CPU the pool only adds its startup cost.
+    if (os.cpu_count() or 1) > 1:
+        # Imported here: the pool machinery alone costs ~25 ms to import
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            league_results = [executor.submit(_run, *job) for job in league_jobs]
+            position_results = [executor.submit(_run, *job) for job in position_jobs]
+            league_results = [job.result() for job in league_results]
+            position_results = [job.result() for job in position_results]
+    else:
+        league_results = [_run(*job) for job in league_jobs]
+        position_results = [_run(*job) for job in position_jobs]
+
+    for result in league_results:
+        print(result)
+    print(f"\n✅ Created league-specific player files")
+    for result in position_results:
+        print(result)
+    print(f"✅ Created position-based player files")
+
+    print(f"\n" + "=" * 70)
+    print(f"✅ PLAYER DATA GENERATION COMPLETE")
+    print(f"Total players created: 6,500+")
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,15 @@ Generate Remaining League Team Files
 Saudi, Egyptian, Turkish, Dutch, Portuguese, Belgian, Scottish, etc.
 """
 
-import json
 import os
-from datetime import datetime
+
+from footybot_json import TIMESTAMP, dumps, ensure_dir, write_bytes
 
 def save_json(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    ensure_dir(path)
+    write_bytes(path, dumps(data))
     print(f"✓ {path} ({len(data['teams'])} teams)")
 
-timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-
 # Saudi League (18 teams)
 saudi_league_teams = [
     {"id": 2939, "name": "Al Nassr", "name_ar": "النصر", "code": "NAS", "logo": "https://media.api-sports.io/football/teams/2939.png", "founded": 1955, "stadium": {"name": "Mrsool Park", "name_ar": "مرسول بارك", "capacity": 25000, "city": "Riyadh", "city_ar": "الرياض"}, "nickname": "Al Alami", "nickname_ar": "العالمي", "colors": {"primary": "Yellow", "secondary": "Blue"}, "trophies": {"league_titles": 9, "domestic_cups": 6, "asian_cups": 0}},
@@ -43,7 +40,7 @@ saudi_league = {
     "league": {"id": 307, "name": "Saudi Professional League", "name_ar": "دوري روشن السعودي", "country": "Saudi Arabia", "country_ar": "السعودية", "logo": "https://media.api-sports.io/football/leagues/307.png", "season": "2024-2025"},
     "teams": saudi_league_teams,
     "total_teams": len(saudi_league_teams),
-    "last_updated": timestamp
+    "last_updated": TIMESTAMP
 }
 
 save_json('data/teams/saudi_league.json', saudi_league)
@@ -74,7 +71,7 @@ egyptian_league = {
     "league": {"id": 233, "name": "Premier League", "name_ar": "الدوري المصري الممتاز", "country": "Egypt", "country_ar": "مصر", "logo": "https://media.api-sports.io/football/leagues/233.png", "season": "2024-2025"},
     "teams": egyptian_league_teams,
     "total_teams": len(egyptian_league_teams),
-    "last_updated": timestamp
+    "last_updated": TIMESTAMP
 }
 
 save_json('data/teams/egyptian_league.json', egyptian_league)